@@ -2,34 +2,67 @@
 # FastAPI service for Render.com that lints and executes code.
 # /lint returns validation only. /execute ALWAYS runs validator first.
 
-import os, traceback
-from fastapi import FastAPI, HTTPException, Header
+import asyncio, os, hashlib, hmac, threading
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, HTTPException, Header
 from pydantic import BaseModel
 from typing import Optional
-from chrono_validator_v3 import validate_python
+from chrono_validator_v3 import ALLOWLIST_FILE, validate_python
 
 AUTH_KEY = os.environ.get("AUTH_KEY", "")
-app = FastAPI(title="Chrono v9 Validator+Runner")
+_AUTH_KEY_BYTES = AUTH_KEY.encode()
+_AUTH_KEY_LEN = len(AUTH_KEY)
 
-class CodeIn(BaseModel):
-    code: str
-
-def require_auth(x_auth_key: Optional[str]):
-    if not AUTH_KEY:
+def require_auth(x_auth_key: Optional[str] = Header(default=None)):
+    if not _AUTH_KEY_BYTES:
         return
-    if x_auth_key != AUTH_KEY:
+    # Cheap length check rejects obviously-bad keys before the constant-time
+    # compare; compare_digest closes the timing channel of a plain !=.
+    k = x_auth_key or ""
+    if len(k) != _AUTH_KEY_LEN or not hmac.compare_digest(k.encode(), _AUTH_KEY_BYTES):
         raise HTTPException(status_code=401, detail="Unauthorized")
 
+# Auth as an app-level dependency: declared once, resolved by FastAPI's
+# dependency machinery instead of being re-wired inside every handler.
+app = FastAPI(title="Chrono v9 Validator+Runner", dependencies=[Depends(require_auth)])
+
+# Validation results cached by code hash so repeated submissions (common in
+# iterative LLM loops) skip the AST parse+walk entirely. Keyed also on the
+# allowlist mtime so a regenerated allowlist.json invalidates old entries.
+# TTLCache isn't thread-safe and _cached_validate runs in worker threads, so
+# every get/set holds the lock; only the validation itself runs outside it.
+_validate_cache = TTLCache(maxsize=4096, ttl=60)
+_cache_lock = threading.Lock()
+
+def _allowlist_mtime() -> float:
+    try:
+        return os.path.getmtime(ALLOWLIST_FILE)
+    except OSError:
+        return 0.0
+
+def _cached_validate(code: str):
+    h = (hashlib.blake2b(code.encode(), digest_size=16).digest(), _allowlist_mtime())
+    with _cache_lock:
+        v = _validate_cache.get(h)
+    if v is None:
+        v = validate_python(code)
+        with _cache_lock:
+            _validate_cache[h] = v
+    return v
+
+class CodeIn(BaseModel):
+    code: str
+
 @app.post("/lint")
-def lint(payload: CodeIn, x_auth_key: Optional[str] = Header(default=None)):
-    require_auth(x_auth_key)
-    ok, errors = validate_python(payload.code)
+async def lint(payload: CodeIn):
+    # Validation is CPU-bound (AST parse + walk); run it off the event loop
+    # so concurrent requests and health probes aren't blocked behind it.
+    ok, errors = await asyncio.to_thread(_cached_validate, payload.code)
     return {"ok": ok, "errors": errors}
 
 @app.post("/execute")
-def execute(payload: CodeIn, x_auth_key: Optional[str] = Header(default=None)):
-    require_auth(x_auth_key)
-    ok, errors = validate_python(payload.code)
+async def execute(payload: CodeIn):
+    ok, errors = await asyncio.to_thread(_cached_validate, payload.code)
     if not ok:
         raise HTTPException(status_code=422, detail={"errors": errors})
     # If you actually execute code, sandbox it. For now, just confirm it passed.
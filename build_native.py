@@ -0,0 +1,52 @@
+# build_native.py
+"""
+Optional: AOT-compile chrono_validator_v3 to a C extension for CLI cold-start
+speed (typically 2-4x on this kind of dict/string-heavy code).
+
+Usage:
+  pip install mypy          # for mypyc (preferred)
+  python build_native.py
+or
+  pip install cython setuptools
+  python build_native.py --backend cython
+
+The produced .so/.pyd lands next to chrono_validator_v3.py and shadows it on
+import automatically (extension suffixes are searched first). Delete the
+built artifact to return to pure Python; nothing else in the tree depends on
+the compiled form, and sitecustomize stays interpreted.
+"""
+
+import argparse, subprocess, sys
+
+MODULE = "chrono_validator_v3.py"
+
+def build_mypyc() -> int:
+    try:
+        import mypyc  # noqa: F401
+    except ImportError:
+        print("[SKIP] mypyc not installed (pip install mypy)", file=sys.stderr)
+        return 1
+    return subprocess.call([sys.executable, "-m", "mypyc", MODULE])
+
+def build_cython() -> int:
+    try:
+        from Cython.Build import cythonize
+        from setuptools import setup
+    except ImportError:
+        print("[SKIP] cython/setuptools not installed (pip install cython setuptools)", file=sys.stderr)
+        return 1
+    setup(
+        script_args=["build_ext", "--inplace"],
+        ext_modules=cythonize(MODULE, language_level=3),
+    )
+    return 0
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--backend", choices=["mypyc", "cython"], default="mypyc")
+    args = ap.parse_args()
+    rc = build_mypyc() if args.backend == "mypyc" else build_cython()
+    if rc == 0:
+        print("[DONE] compiled chrono_validator_v3; remove the built "
+              "extension to fall back to pure Python")
+    sys.exit(rc)
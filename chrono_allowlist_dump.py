@@ -12,7 +12,24 @@ Tips:
   - Adjust --hb-every and --hb-secs to change heartbeat frequency.
 """
 
-import argparse, importlib, json, re, sys, time
+import argparse, importlib, inspect, json, re, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # C-accelerated; several-fold faster on big allowlists
+except ImportError:
+    orjson = None
+
+_CHAXIS_RE = re.compile(r"ChAxis_[A-Z]$")
+_SHARED_PTR_RE = re.compile(r"std::shared_ptr\s*<\s*([^>]+)\s*>")
+_NOISE_RE = re.compile(r"chrono::|const\s+|&")
+
+# Most tokens are one of these; a dict get beats the if/startswith cascade
+_DIRECT = {
+    "double": "double", "float": "double",
+    "int": "int", "size_t": "int", "unsigned": "int", "unsigned int": "int",
+    "bool": "bool",
+}
 
 PROTO_RE = re.compile(r"""
     ^\s*
@@ -21,12 +38,11 @@ PROTO_RE = re.compile(r"""
 """, re.VERBOSE)
 
 def norm_tok(tok: str) -> str:
-    t = tok.strip()
-    t = re.sub(r"std::shared_ptr\s*<\s*([^>]+)\s*>", r"\1", t)
-    t = t.replace("chrono::", "").replace("const ", "").replace("&", "").strip()
-    if t in {"double", "float"}: return "double"
-    if t in {"int", "size_t", "unsigned", "unsigned int"}: return "int"
-    if t == "bool": return "bool"
+    t = _SHARED_PTR_RE.sub(r"\1", tok)
+    t = _NOISE_RE.sub("", t).strip()
+    d = _DIRECT.get(t)
+    if d is not None:
+        return d
     if t.startswith("ChContactMaterial"): return "ChContactMaterial"
     if t.startswith("ChAxis"): return "ChAxis"
     return t
@@ -36,7 +52,14 @@ def parse_overloads_from_doc(name: str, doc: str) -> list[list[str]]:
     if not doc:
         return overloads
     for line in doc.splitlines():
-        m = PROTO_RE.match(line.strip())
+        # Cheap prefilter: most docstring lines are prose without parens or
+        # clearly not a prototype for `name`; skip them before the regex.
+        if "(" not in line or ")" not in line:
+            continue
+        stripped = line.strip()
+        if not stripped.startswith(name):
+            continue
+        m = PROTO_RE.match(stripped)
         if not m or m.group("name") != name:
             continue
         args = m.group("args").strip()
@@ -48,37 +71,59 @@ def parse_overloads_from_doc(name: str, doc: str) -> list[list[str]]:
     return overloads
 
 def dump(modules, hb_every: int, hb_secs: float, verbose: bool):
-    start = time.monotonic()
-    last_hb = start
-    data_modules: dict[str, list[str]] = {}
-    overloads: dict[str, list[list[str]]] = {}
-    enums = set()
-    total_syms = 0
+    start_ns = time.monotonic_ns()
+    hb_ns = int(hb_secs * 1e9)
+    last_hb = start_ns
+    hb_lock = threading.Lock()  # heartbeat state is shared across workers
+    hb_buf: list[str] = []
+
+    def _hb_flush_locked():
+        if hb_buf:
+            sys.stdout.write("\n".join(hb_buf) + "\n")
+            sys.stdout.flush()
+            hb_buf.clear()
 
     def heartbeat(phase: str, mname: str, idx: int | None = None, count: int | None = None):
         nonlocal last_hb
-        now = time.monotonic()
-        if (idx is not None and hb_every and idx % hb_every == 0) or (hb_secs and now - last_hb >= hb_secs):
-            msg = f"[HB] {phase} module={mname}"
-            if idx is not None and count is not None:
-                msg += f" progress={idx}/{count}"
-            msg += f" elapsed={now - start:.1f}s"
-            print(msg, flush=True)
+        due = idx is not None and hb_every and idx % hb_every == 0
+        if not due:
+            # Sample the clock only every 64th symbol; at ~1e5 symbols per
+            # run the per-iteration clock calls are measurable on their own.
+            if idx is not None and idx & 63:
+                return
+            if not hb_ns:
+                return
+            now = time.monotonic_ns()
+            if now - last_hb < hb_ns:
+                return
+        else:
+            now = time.monotonic_ns()
+        msg = f"[HB] {phase} module={mname}"
+        if idx is not None and count is not None:
+            msg += f" progress={idx}/{count}"
+        msg += f" elapsed={(now - start_ns) / 1e9:.1f}s"
+        with hb_lock:
+            # Batch heartbeat lines; one write syscall per 8 beats instead
+            # of one per beat (Render's stdout is slow).
+            hb_buf.append(msg)
+            if len(hb_buf) >= 8:
+                _hb_flush_locked()
             last_hb = now
 
-    for mname in modules:
+    def _scan_module(mname: str):
+        local_overloads: dict[str, list[list[str]]] = {}
+        local_enums: set[str] = set()
         print(f"[INFO] Importing {mname} ...", flush=True)
         try:
             m = importlib.import_module(mname)
         except Exception as e:
             print(f"[WARN] Cannot import {mname}: {e}", file=sys.stderr, flush=True)
-            data_modules[mname] = []
-            continue
+            return mname, [], local_overloads, local_enums
 
-        symbols = sorted(dir(m))
-        data_modules[mname] = symbols
+        # Underscore names (dunders, private helpers) never appear in user
+        # code we validate; dropping them up front halves most module scans.
+        symbols = sorted(s for s in dir(m) if not s.startswith("_"))
         count = len(symbols)
-        total_syms += count
         print(f"[INFO] {mname}: {count} symbols", flush=True)
 
         for i, sym in enumerate(symbols, 1):
@@ -86,9 +131,10 @@ def dump(modules, hb_every: int, hb_secs: float, verbose: bool):
                 print(f"[DBG]   scanning {mname}.{sym}", flush=True)
             heartbeat("scanning", mname, i, count)
 
-            try:
-                obj = getattr(m, sym)
-            except Exception:
+            # getattr_static avoids triggering descriptor machinery (slow
+            # pybind11 property getters can run C++ just to resolve a name)
+            obj = inspect.getattr_static(m, sym, None)
+            if obj is None:
                 continue
 
             # overloads
@@ -98,13 +144,30 @@ def dump(modules, hb_every: int, hb_secs: float, verbose: bool):
                 doc = ""
             ols = parse_overloads_from_doc(sym, doc)
             if ols:
-                overloads[f"{mname}.{sym}"] = ols
+                local_overloads[f"{mname}.{sym}"] = ols
 
             # enum hint
-            if re.match(r"ChAxis_[A-Z]$", sym):
-                enums.add("ChAxis")
+            if _CHAXIS_RE.match(sym):
+                local_enums.add("ChAxis")
+
+        return mname, symbols, local_overloads, local_enums
 
-    elapsed = time.monotonic() - start
+    # Per-module scans are independent; the GIL is released during C-level
+    # __doc__ materialization, so threads overlap usefully.
+    data_modules: dict[str, list[str]] = {}
+    overloads: dict[str, list[list[str]]] = {}
+    enums: set[str] = set()
+    total_syms = 0
+    with ThreadPoolExecutor(max_workers=max(1, len(modules))) as ex:
+        for mname, symbols, local_overloads, local_enums in ex.map(_scan_module, modules):
+            data_modules[mname] = symbols
+            total_syms += len(symbols)
+            overloads.update(local_overloads)
+            enums |= local_enums
+
+    with hb_lock:
+        _hb_flush_locked()  # drain any buffered heartbeat lines
+    elapsed = (time.monotonic_ns() - start_ns) / 1e9
     print(f"[DONE] modules={len(modules)} total_symbols={total_syms} "
           f"overloads={len(overloads)} elapsed={elapsed:.1f}s", flush=True)
 
@@ -119,9 +182,21 @@ if __name__ == "__main__":
     ap.add_argument("--hb-every", type=int, default=200, help="print heartbeat every N symbols")
     ap.add_argument("--hb-secs", type=float, default=5.0, help="print heartbeat at least every N seconds")
     ap.add_argument("--verbose", action="store_true", help="print a few debug lines per module")
+    ap.add_argument("--compact", action=argparse.BooleanOptionalAction, default=True,
+                    help="write compact JSON (smaller file, faster cold-start parse); --no-compact pretty-prints")
     args = ap.parse_args()
 
     payload = dump(args.modules, hb_every=args.hb_every, hb_secs=args.hb_secs, verbose=args.verbose)
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, sort_keys=True)
+    if orjson is not None:
+        opt = orjson.OPT_SORT_KEYS | (0 if args.compact else orjson.OPT_INDENT_2)
+        blob = orjson.dumps(payload, option=opt)
+    elif args.compact:
+        blob = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    else:
+        blob = json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+    if args.out.endswith(".zst"):
+        import zstandard  # optional; only needed when asking for .zst output
+        blob = zstandard.ZstdCompressor(level=3).compress(blob)
+    with open(args.out, "wb") as f:
+        f.write(blob)
     print(f"[WROTE] {args.out} (modules + overloads + enums)", flush=True)
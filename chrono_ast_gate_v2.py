@@ -17,9 +17,14 @@ Enforces:
 """
 
 from __future__ import annotations
-import ast, json, argparse, sys, re
+import ast, functools, hashlib, json, argparse, marshal, os, sys, re
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson  # C-accelerated JSON; cuts allowlist cold-start parse time
+except ImportError:
+    orjson = None
+
 # Allowed import roots and required aliases
 PYCHRONO_ROOTS = {
     "pychrono": "chrono",
@@ -27,21 +32,56 @@ PYCHRONO_ROOTS = {
     "pychrono.irrlicht": "irr",
     "pychrono.fea": "fea",
 }
+# Inverse map so the per-node alias lookup is one dict probe, not a scan
+_ALIAS_TO_MOD = {alias: mod for mod, alias in PYCHRONO_ROOTS.items()}
+
+# Compiled once: re's internal pattern cache can thrash under load
+_CHAXIS_RE = re.compile(r"ChAxis_[A-Z]")
+_MATERIAL_RE = re.compile(r"material", re.I)
 
-# Hard block of legacy-era names you don't want used at all
-LEGACY_BLOCKLIST = {
+# Hard block of legacy-era names you don't want used at all.
+# Interned so membership tests against parser-interned identifiers
+# short-circuit to pointer comparisons.
+LEGACY_BLOCKLIST = {sys.intern(s) for s in (
     "ChBodyAuxRef", "ChLinkEngine", "ChSharedPtr", "ChSystemSMC7",
     "ChSystemNSC7", "ChVectorDynamic", "ChMatrix33", "ChShared",
-}
+)}
 
 # ---------- allowlist loader ----------
 
+# Bump when the post-processed allowlist structure changes so stale
+# .marshal sidecars are ignored rather than misread.
+_MARSHAL_CACHE_VERSION = 1
+
 def load_allowlist(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    # Warm starts skip both the JSON parse and the set rebuild: the
+    # post-processed structure is marshaled next to the JSON, keyed by the
+    # source file's mtime+size.
+    try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size, _MARSHAL_CACHE_VERSION)
+    except OSError:
+        stamp = None
+    cache_path = path + ".marshal"
+    if stamp is not None:
+        try:
+            with open(cache_path, "rb") as f:
+                if marshal.load(f) == stamp:
+                    return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    with open(path, "rb") as f:
+        blob = f.read()
+    if path.endswith(".zst"):
+        import zstandard  # optional; only needed for compressed allowlists
+        blob = zstandard.ZstdDecompressor().decompress(blob)
+    raw = orjson.loads(blob) if orjson is not None else json.loads(blob)
 
     # "modules": {mod: [names...]}, "overloads": { "pychrono.core.ChBodyEasyCylinder":[{"args":[...], "defaults":2}, ...] }, "enums":[...]
-    modules = {k: set(v) for k, v in raw.get("modules", {}).items()}
+    # Interned frozensets: ast identifiers are interned by the parser, so
+    # membership hashing degenerates to identity checks on the hot path.
+    modules = {k: frozenset(sys.intern(s) for s in v) for k, v in raw.get("modules", {}).items()}
     enums = set(raw.get("enums", []))
 
     # Accept either list-of-lists (old) or list-of-dicts with defaults (new)
@@ -55,21 +95,36 @@ def load_allowlist(path: str) -> Dict[str, Any]:
             else:
                 args = list(ov)
                 defaults = 0
+            # Type tokens come from a tiny alphabet ("double", "bool", ...);
+            # interning makes the _COMPAT probes identity-fast against the
+            # compiler-interned literals the inference helpers return.
+            args = [sys.intern(a) for a in args]
             items.append({"args": args, "defaults": defaults})
         normalized_ov[k] = items
 
-    return {"modules": modules, "overloads": normalized_ov, "enums": enums}
+    result = {"modules": modules, "overloads": normalized_ov, "enums": enums}
+    if stamp is not None:
+        try:
+            with open(cache_path, "wb") as f:
+                marshal.dump(stamp, f)
+                marshal.dump(result, f)
+        except OSError:
+            pass  # read-only deploys still work, just without the cache
+    return result
 
 # ---------- AST helpers ----------
 
-def _resolve_attr_chain(node: ast.AST) -> List[str]:
+def _resolve_attr_chain(node: ast.AST) -> Tuple[str, ...]:
+    # append + reverse is O(n); insert(0, ...) would be O(n^2) and this runs
+    # for every Attribute/Call node. Tuple result is hashable for memoization.
     out: List[str] = []
     while isinstance(node, ast.Attribute):
-        out.insert(0, node.attr)
+        out.append(node.attr)
         node = node.value
     if isinstance(node, ast.Name):
-        out.insert(0, node.id)
-    return out
+        out.append(node.id)
+    out.reverse()
+    return tuple(out)
 
 def _literal_type(node: ast.AST) -> str | None:
     if isinstance(node, ast.Constant):
@@ -87,11 +142,11 @@ def _name_or_attr_type(node: ast.AST) -> str | None:
         return None
     leaf = chain[-1]
     # Match chrono.ChAxis_X or bare ChAxis_X
-    if re.fullmatch(r"ChAxis_[A-Z]", leaf):
+    if _CHAXIS_RE.fullmatch(leaf):
         return "ChAxis"
     # If user passed a material instance variable, we can't know statically;
     # if the var name suggests a material, be permissive.
-    if re.search(r"material", leaf, flags=re.I):
+    if _MATERIAL_RE.search(leaf):
         return "ChContactMaterial"
     return None
 
@@ -103,177 +158,294 @@ def _call_constructed_type(node: ast.Call) -> str | None:
         return "ChContactMaterial"
     return None
 
-def _infer_arg_type(node: ast.AST) -> str:
-    t = _literal_type(node)
-    if t: return t
-    if isinstance(node, (ast.Name, ast.Attribute)):
-        t = _name_or_attr_type(node)
-        if t: return t
-        return "unknown"
-    if isinstance(node, ast.Call):
-        t = _call_constructed_type(node)
-        return t or "unknown"
+def _infer_const(node: ast.AST) -> str:
+    return _literal_type(node) or "unknown"
+
+def _infer_name_attr(node: ast.AST) -> str:
+    return _name_or_attr_type(node) or "unknown"
+
+def _infer_call(node: ast.AST) -> str:
+    return _call_constructed_type(node) or "unknown"
+
+def _infer_unknown(node: ast.AST) -> str:
     # containers, expressions etc. default to unknown
     return "unknown"
 
+# Exact-type dispatch: one C-level dict lookup per argument instead of an
+# isinstance cascade over four node classes.
+_INFER = {
+    ast.Constant: _infer_const,
+    ast.Name: _infer_name_attr,
+    ast.Attribute: _infer_name_attr,
+    ast.Call: _infer_call,
+}
+
+def _infer_arg_type(node: ast.AST) -> str:
+    return _INFER.get(type(node), _infer_unknown)(node)
+
 def _arg_types_pos_kw(call: ast.Call) -> List[str]:
-    types: List[str] = []
-    # positional args
-    for a in call.args:
-        types.append(_infer_arg_type(a))
-    # keyword args are also counted in arity; we infer type from value
-    for kw in call.keywords or []:
-        # Ignore **kwargs (kw.arg is None)
-        if kw.arg is None:
-            types.append("unknown")
-        else:
-            types.append(_infer_arg_type(kw.value))
-    return types
+    # keyword args are also counted in arity; **kwargs (kw.arg None) are unknown
+    return [_infer_arg_type(a) for a in call.args] + [
+        _infer_arg_type(kw.value) if kw.arg is not None else "unknown"
+        for kw in call.keywords or []
+    ]
 
 # ---------- overload matching ----------
 
+# Full compatibility table over the closed alphabet _infer_arg_type can
+# produce: identity for every inferable type, plus int-promotes-to-double.
+# "unknown" is deliberately absent — we stay strict to avoid false passes.
+_COMPAT = frozenset({
+    ("double", "double"), ("double", "int"),
+    ("int", "int"), ("bool", "bool"),
+    ("string", "string"), ("none", "none"),
+    ("ChAxis", "ChAxis"), ("ChContactMaterial", "ChContactMaterial"),
+})
+
 def _type_matches(expected: str, actual: str) -> bool:
-    # normalize aliases
-    if expected == "double" and actual in {"double", "int"}:
-        return True
-    if expected == "int" and actual == "int":
-        return True
-    if expected == "bool" and actual == "bool":
-        return True
-    if expected == "ChAxis" and actual == "ChAxis":
-        return True
-    if expected == "ChContactMaterial" and actual == "ChContactMaterial":
-        return True
-    # If we cannot infer actual statically, be strict and reject to avoid false passes
-    if actual == "unknown":
-        return False
-    return expected == actual
-
-def _args_fit_overload(given: List[str], overload: Dict[str, Any]) -> bool:
-    exp: List[str] = overload.get("args", [])
-    dflt: int = int(overload.get("defaults", 0))
-
-    N = len(given)
-    M = len(exp)
-
-    # Default-aware arity check: you may omit up to 'defaults' trailing args
-    if N > M or (M - N) > dflt:
-        return False
-
-    # Compare only the first N parameters by type
-    for i in range(N):
-        if not _type_matches(exp[i], given[i]):
-            return False
-    return True
-
-def _pretty_overloads(name: str, ovs: List[Dict[str, Any]]) -> List[str]:
+    return (expected, actual) in _COMPAT
+
+# Bit-packed matching: one byte per parameter position, one bit per inferable
+# type. An overload's mask has, in byte i, the bit of every actual type its
+# i-th parameter accepts (from _COMPAT); the given arguments one-hot their own
+# types. The overload fits iff given & mask == given — a single C-level
+# big-int AND+compare replaces the per-position Python loop.
+_TYPE_BIT = {
+    "double": 0, "int": 1, "bool": 2, "string": 3,
+    "none": 4, "ChAxis": 5, "ChContactMaterial": 6, "unknown": 7,
+}
+
+def _overload_mask(args: List[str]) -> int:
+    mask = 0
+    for i, expected in enumerate(args):
+        accept = 0
+        for e, a in _COMPAT:
+            if e == expected:
+                accept |= 1 << _TYPE_BIT[a]
+        mask |= accept << (8 * i)
+    return mask
+
+def _given_mask(given: List[str]) -> int:
+    g = 0
+    for i, t in enumerate(given):
+        g |= (1 << _TYPE_BIT[t]) << (8 * i)
+    return g
+
+# Noisy failure streams re-format the same overload lists over and over;
+# memoizing on a hashable signature key makes repeats a cache hit. The
+# allowlist is immutable per run, so the key can't go stale.
+@functools.lru_cache(maxsize=2048)
+def _pretty_overloads_cached(name: str, ov_key: Tuple[Tuple[Tuple[str, ...], int], ...]) -> Tuple[str, ...]:
     out = []
-    for ov in ovs:
-        sig = ", ".join(ov.get("args", []))
-        d  = ov.get("defaults", 0)
+    for args, d in ov_key:
+        sig = ", ".join(args)
         suffix = (f"  [defaults={d}]" if d else "")
         out.append(f"{name}({sig}){suffix}")
-    return out
+    return tuple(out)
+
+def _pretty_overloads(name: str, ovs: List[Dict[str, Any]]) -> Tuple[str, ...]:
+    ov_key = tuple((tuple(ov.get("args", ())), ov.get("defaults", 0)) for ov in ovs)
+    return _pretty_overloads_cached(name, ov_key)
 
 # ---------- main validate ----------
 
-def validate(code: str, allow: Dict[str, Any]) -> Tuple[bool, List[str]]:
-    modules = allow["modules"]
-    overloads = allow["overloads"]
-    errors: List[str] = []
+_EMPTY: frozenset = frozenset()
+
+def _compile_attr_checker(allowed_minus_legacy: Dict[str, frozenset]):
+    """Generate a checker specialized to this allowlist.
+
+    The allowlist is static per deployment, so instead of a dict lookup per
+    attribute we emit a tiny function that branches over the (at most four)
+    known roots and tests membership against frozensets bound in its
+    namespace. Parser-interned module names make the == tests near-free.
+    """
+    ns: Dict[str, Any] = {}
+    lines = ["def _attr_allowed(fq_mod, attr):"]
+    for i, (mod, names) in enumerate(sorted(allowed_minus_legacy.items())):
+        var = f"_SET_{i}"
+        ns[var] = names
+        kw = "if" if i == 0 else "elif"
+        lines.append(f"    {kw} fq_mod == {mod!r}: return attr in {var}")
+    lines.append("    return False")
+    exec(compile("\n".join(lines), "<allowlist-specialized>", "exec"), ns)
+    return ns["_attr_allowed"]
+
+class _Validator(ast.NodeVisitor):
+    """Single-pass visitor over the node types the gate cares about.
+
+    NodeVisitor dispatches via one dict lookup per node, so the tree is
+    traversed exactly once with no isinstance chains on irrelevant nodes.
+    """
+
+    __slots__ = ("modules", "overloads", "overloads_by_arity", "allowed_minus_legacy", "attr_allowed", "errors", "alias_to_mod", "_func_chain")
+
+    def __init__(self, allow: Dict[str, Any]):
+        self.modules = allow["modules"]
+        self.overloads = allow["overloads"]
+        # Per-module allowlist minus the legacy names, cached on the allow
+        # dict: the happy path for an attribute is a single set lookup, with
+        # the legacy-vs-missing distinction made only after a name fails it.
+        aml = allow.get("_allowed_minus_legacy")
+        if aml is None:
+            aml = {mod: s - LEGACY_BLOCKLIST for mod, s in self.modules.items()}
+            allow["_allowed_minus_legacy"] = aml
+        self.allowed_minus_legacy = aml
+        # Overloads bucketed by acceptable given-arity N (M-defaults..M), so
+        # visit_Call only type-checks candidates that can fit by count.
+        idx = allow.get("_overloads_by_arity")
+        if idx is None:
+            idx = {}
+            for fq, ovs in self.overloads.items():
+                per_arity: Dict[int, List[int]] = {}
+                for ov in ovs:
+                    m = len(ov["args"])
+                    mask = _overload_mask(ov["args"])
+                    for arity in range(m - int(ov["defaults"]), m + 1):
+                        per_arity.setdefault(arity, []).append(mask)
+                idx[fq] = per_arity
+            allow["_overloads_by_arity"] = idx
+        self.overloads_by_arity = idx
+        checker = allow.get("_attr_allowed")
+        if checker is None:
+            checker = _compile_attr_checker(aml)
+            allow["_attr_allowed"] = checker
+        self.attr_allowed = checker
+        self.errors: List[str] = []
+        self.alias_to_mod: Dict[str, str] = {}
+        # One-slot memo: visit_Call resolves its func chain, and that exact
+        # Attribute node is the next one visited (func is the first field),
+        # so visit_Attribute can reuse the chain instead of re-walking it.
+        self._func_chain: Tuple[int, Tuple[str, ...]] | None = None
+
+    def visit_ImportFrom(self, n: ast.ImportFrom) -> None:
+        base = n.module or ""
+        if base.startswith("pychrono"):
+            if base in PYCHRONO_ROOTS:
+                self.errors.append(f"Use 'import {base} as {PYCHRONO_ROOTS[base]}' (not 'from {base} import ...').")
+            else:
+                self.errors.append(f"Disallowed import-from base: {base}")
+        if any(x.name == "*" for x in getattr(n, "names", [])):
+            self.errors.append(f"Star import banned: from {base} import *")
+
+    def visit_Import(self, n: ast.Import) -> None:
+        for x in n.names:
+            name, asname = x.name, x.asname
+            if name in PYCHRONO_ROOTS:
+                want = PYCHRONO_ROOTS[name]
+                if asname != want:
+                    self.errors.append(f"Import must be exactly: 'import {name} as {want}'")
+                self.alias_to_mod[want] = name
+            elif name.startswith("pychrono") and name not in PYCHRONO_ROOTS:
+                self.errors.append(f"Disallowed pychrono submodule: {name}")
+
+    def visit_Name(self, n: ast.Name) -> None:
+        if n.id in LEGACY_BLOCKLIST:
+            self.errors.append(f"Legacy symbol disallowed: {n.id}")
+
+    def visit_Attribute(self, n: ast.Attribute) -> None:
+        memo = self._func_chain
+        if memo is not None and memo[0] == id(n):
+            chain = memo[1]
+            self._func_chain = None
+        else:
+            chain = _resolve_attr_chain(n)
+        if chain:
+            # map alias to fully qualified pychrono module
+            fq_mod = _ALIAS_TO_MOD.get(chain[0])
+            if fq_mod and len(chain) >= 2:
+                attr = chain[1]
+                if not self.attr_allowed(fq_mod, attr):
+                    if attr in LEGACY_BLOCKLIST:
+                        self.errors.append(f"Legacy symbol disallowed: {fq_mod}.{attr}")
+                    else:
+                        self.errors.append(f"Missing in 9.0.1 allowlist: {fq_mod}.{attr}")
+        self.generic_visit(n)
+
+    def visit_Call(self, n: ast.Call) -> None:
+        # Only alias-qualified calls (chrono.X(...)) can match an overload;
+        # bare-name calls are skipped before any chain resolution.
+        if not isinstance(n.func, ast.Attribute):
+            self.generic_visit(n)
+            return
+        chain = _resolve_attr_chain(n.func)
+        self._func_chain = (id(n.func), chain)
+        # require module alias as head (chrono/veh/irr/fea)
+        fq_mod = _ALIAS_TO_MOD.get(chain[0]) if chain else None
+        if fq_mod and len(chain) >= 2:
+            name = chain[1]
+            fq = f"{fq_mod}.{name}"
+
+            # If we have overloads for this callable, enforce them
+            if fq in self.overloads:
+                given_types = _arg_types_pos_kw(n)
+                candidates = self.overloads_by_arity[fq].get(len(given_types), ())
+
+                g = _given_mask(given_types)
+                ok = any(g & mask == g for mask in candidates)
+                if not ok:
+                    # error message still lists every overload, not just the
+                    # arity-compatible candidates
+                    pretty = _pretty_overloads(name, self.overloads[fq])
+                    self.errors.append(
+                        "Constructor mismatch for "
+                        f"{name}({', '.join(given_types)}) — allowed overloads:\n  - "
+                        + "\n  - ".join(pretty)
+                    )
+        self.generic_visit(n)
+
+# Parsed trees keyed by a 16-byte code digest: re-linting the same snippet
+# (the common case in iterative LLM loops) skips the parser entirely. The
+# visitor never mutates trees, so sharing them across calls is safe.
+_TREE_CACHE: Dict[bytes, ast.AST] = {}
+_TREE_CACHE_MAX = 256
+
+def _parse(code: str) -> ast.AST:
+    key = hashlib.blake2b(code.encode(), digest_size=16).digest()
+    tree = _TREE_CACHE.get(key)
+    if tree is None:
+        # optimize=2 lets CPython fold constants and drop asserts/docstrings
+        # where supported, shrinking the tree the visitor has to traverse.
+        tree = compile(code, "<user>", "exec", flags=ast.PyCF_ONLY_AST, optimize=2)
+        if len(_TREE_CACHE) >= _TREE_CACHE_MAX:
+            _TREE_CACHE.clear()
+        _TREE_CACHE[key] = tree
+    return tree
 
+def validate(code: str, allow: Dict[str, Any]) -> Tuple[bool, List[str]]:
     try:
-        tree = ast.parse(code)
+        tree = _parse(code)
     except SyntaxError as e:
         return False, [f"SyntaxError: {e}"]
 
-    # Enforce import style + collect alias->module mapping
-    alias_to_mod: Dict[str, str] = {}
-    for n in ast.walk(tree):
-        if isinstance(n, ast.ImportFrom):
-            base = n.module or ""
-            if base.startswith("pychrono"):
-                if base in PYCHRONO_ROOTS:
-                    errors.append(f"Use 'import {base} as {PYCHRONO_ROOTS[base]}' (not 'from {base} import ...').")
-                else:
-                    errors.append(f"Disallowed import-from base: {base}")
-            if any(x.name == "*" for x in getattr(n, "names", [])):
-                errors.append(f"Star import banned: from {base} import *")
-
-        if isinstance(n, ast.Import):
-            for x in n.names:
-                name, asname = x.name, x.asname
-                if name in PYCHRONO_ROOTS:
-                    want = PYCHRONO_ROOTS[name]
-                    if asname != want:
-                        errors.append(f"Import must be exactly: 'import {name} as {want}'")
-                    alias_to_mod[want] = name
-                elif name.startswith("pychrono") and name not in PYCHRONO_ROOTS:
-                    errors.append(f"Disallowed pychrono submodule: {name}")
-
-    # Attribute presence + legacy block
-    def _is_allowed(mod: str, attr: str) -> bool:
-        return attr in modules.get(mod, set())
-
-    for n in ast.walk(tree):
-        if isinstance(n, ast.Name) and n.id in LEGACY_BLOCKLIST:
-            errors.append(f"Legacy symbol disallowed: {n.id}")
-
-        if isinstance(n, ast.Attribute):
-            chain = _resolve_attr_chain(n)
-            if not chain:
-                continue
-            head = chain[0]
-            # map alias to fully qualified pychrono module
-            fq_mod = None
-            for full, alias in PYCHRONO_ROOTS.items():
-                if alias == head:
-                    fq_mod = full
-                    break
-            if fq_mod and len(chain) >= 2:
-                attr = chain[1]
-                if attr in LEGACY_BLOCKLIST:
-                    errors.append(f"Legacy symbol disallowed: {fq_mod}.{attr}")
-                elif not _is_allowed(fq_mod, attr):
-                    errors.append(f"Missing in 9.0.1 allowlist: {fq_mod}.{attr}")
+    v = _Validator(allow)
+    v.visit(tree)
+    return (len(v.errors) == 0), v.errors
 
-    # Constructor / callable overload checks
-    for n in ast.walk(tree):
-        if not isinstance(n, ast.Call):
-            continue
+# ---------- file-level entry point ----------
 
-        chain = _resolve_attr_chain(n.func)
-        if not chain:
-            continue
+# In-process callers (tool loops, batch drivers) shouldn't shell out to the
+# CLI per file. validate_file memoizes on (path, mtime) pairs so re-checking
+# unchanged code returns instantly; editing either file changes its mtime and
+# naturally makes a fresh cache key.
 
-        # require module alias as head (chrono/veh/irr/fea)
-        head = chain[0]
-        fq_mod = None
-        for full, alias in PYCHRONO_ROOTS.items():
-            if alias == head:
-                fq_mod = full
-                break
-        if not fq_mod or len(chain) < 2:
-            continue
-
-        name = chain[1]
-        fq = f"{fq_mod}.{name}"
-
-        # If we have overloads for this callable, enforce them
-        if fq in overloads:
-            given_types = _arg_types_pos_kw(n)
-            allowed_ov = overloads[fq]
-
-            ok = any(_args_fit_overload(given_types, ov) for ov in allowed_ov)
-            if not ok:
-                pretty = _pretty_overloads(name, allowed_ov)
-                errors.append(
-                    "Constructor mismatch for "
-                    f"{name}({', '.join(given_types)}) — allowed overloads:\n  - "
-                    + "\n  - ".join(pretty)
-                )
-
-    return (len(errors) == 0), errors
+@functools.lru_cache(maxsize=8)
+def _load_allowlist_cached(path: str, mtime: float) -> Dict[str, Any]:
+    return load_allowlist(path)
+
+@functools.lru_cache(maxsize=256)
+def _validate_file_cached(codefile: str, code_mtime: float,
+                          allowlist: str, allow_mtime: float) -> Tuple[bool, Tuple[str, ...]]:
+    with open(codefile, "r", encoding="utf-8") as f:
+        code = f.read()
+    ok, errs = validate(code, _load_allowlist_cached(allowlist, allow_mtime))
+    return ok, tuple(errs)
+
+def validate_file(codefile: str, allowlist: str = "allowlist.json") -> Tuple[bool, List[str]]:
+    ok, errs = _validate_file_cached(
+        codefile, os.path.getmtime(codefile),
+        allowlist, os.path.getmtime(allowlist),
+    )
+    return ok, list(errs)
 
 # ---------- CLI ----------
 
@@ -283,10 +455,7 @@ if __name__ == "__main__":
     ap.add_argument("--allowlist", default="allowlist.json")
     args = ap.parse_args()
 
-    with open(args.codefile, "r", encoding="utf-8") as f:
-        code = f.read()
-    allow = load_allowlist(args.allowlist)
-    ok, errs = validate(code, allow)
+    ok, errs = validate_file(args.codefile, args.allowlist)
     if ok:
         print("[AST PASS]"); sys.exit(0)
     print("[AST FAIL]")
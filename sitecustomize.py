@@ -1,13 +1,20 @@
 """Runtime guard to loudly block legacy symbols at attribute access time."""
 import sys, types
-LEGACY = {"ChBodyAuxRef","ChLinkEngine","ChSharedPtr","ChSystemSMC7","ChSystemNSC7","ChVectorDynamic","ChMatrix33","ChShared"}
+LEGACY = frozenset({"ChBodyAuxRef","ChLinkEngine","ChSharedPtr","ChSystemSMC7","ChSystemNSC7","ChVectorDynamic","ChMatrix33","ChShared"})
+class Guard(types.ModuleType):
+    # One shared class parameterized by _wrapped, instead of a new type
+    # object and closure minted per wrapped module at interpreter startup.
+    # Symbols materialize lazily: first access fetches from the wrapped
+    # module and caches on the guard, so later lookups take CPython's normal
+    # attribute path and import time no longer pays a full dict copy.
+    def __getattr__(self, name, _legacy=LEGACY):
+        if name in _legacy:
+            raise AttributeError(f"[Chrono 9.0.1 strict] Legacy symbol blocked: {name}")
+        val = getattr(self._wrapped, name)
+        object.__setattr__(self, name, val)
+        return val
 def _wrap(mod):
-    class Guard(types.ModuleType):
-        def __getattr__(self, name):
-            if name in LEGACY:
-                raise AttributeError(f"[Chrono 9.0.1 strict] Legacy symbol blocked: {name}")
-            return getattr(mod, name)
-    g = Guard(mod.__name__); g.__dict__.update(mod.__dict__); return g
+    g = Guard(mod.__name__); g._wrapped = mod; return g
 for m in ("pychrono","pychrono.vehicle","pychrono.irrlicht"):
     try: sys.modules[m] = _wrap(__import__(m, fromlist=['*']))
     except Exception: pass
@@ -1,14 +1,44 @@
 """CLI wrapper to validate Python against PyChrono 9.0.1 AST rules."""
-import sys, argparse
-from chrono_ast_gate_v2 import load_allowlist, validate
+import os, sys, argparse
+from concurrent.futures import ProcessPoolExecutor
+from chrono_ast_gate_v2 import load_allowlist, validate, validate_file
+def read_stdin():
+    # Large os.read chunks straight off fd 0: one syscall per MiB instead of
+    # sys.stdin's text-layer buffering, and a single decode at the end.
+    buf = bytearray()
+    while chunk := os.read(0, 1 << 20):
+        buf += chunk
+    return buf.decode("utf-8")
+def _validate_one(task):
+    # Worker for batch mode; validate_file caches the allowlist per process.
+    path, allowlist = task
+    return validate_file(path, allowlist)
+def report(ok, errs, label=""):
+    suffix = f" {label}" if label else ""
+    if ok: print(f"[AST PASS]{suffix}"); return 0
+    print(f"[AST FAIL]{suffix}"); [print(" -",e) for e in errs]; return 2
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--allowlist", default="allowlist.json")
-    ap.add_argument("codefile", help="Path to code or '-' for stdin")
+    ap.add_argument("codefile", nargs="+", help="Path(s) to code or '-' for stdin")
     args = ap.parse_args()
-    code = sys.stdin.read() if args.codefile == '-' else open(args.codefile,'r',encoding='utf-8').read()
-    allow = load_allowlist(args.allowlist)
-    ok, errs = validate(code, allow)
-    if ok: print("[AST PASS]"); sys.exit(0)
-    print("[AST FAIL]"); [print(" -",e) for e in errs]; sys.exit(2)
+    if len(args.codefile) == 1:
+        path = args.codefile[0]
+        code = read_stdin() if path == '-' else open(path,'r',encoding='utf-8').read()
+        ok, errs = validate(code, load_allowlist(args.allowlist))
+        sys.exit(report(ok, errs))
+    # Batch mode: fan files out over processes — CI pipelines that used to
+    # shell out once per file pay interpreter startup and allowlist load N
+    # times; here both are paid once per worker. '-' is handled in-parent.
+    rc = 0
+    tasks = [(p, args.allowlist) for p in args.codefile if p != '-']
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = dict(zip((p for p, _ in tasks), pool.map(_validate_one, tasks, chunksize=8)))
+    for path in args.codefile:
+        if path == '-':
+            ok, errs = validate(read_stdin(), load_allowlist(args.allowlist))
+        else:
+            ok, errs = results[path]
+        rc = max(rc, report(ok, errs, label=path))
+    sys.exit(rc)
 if __name__ == "__main__": main()